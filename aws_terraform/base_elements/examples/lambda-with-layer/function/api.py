@@ -3,19 +3,44 @@ API Lambda function with Function URL support.
 Handles HTTP requests through Lambda Function URL.
 """
 
+import base64
+import binascii
+import functools
 import json
 import os
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 
+# orjson is optional: fall back to the stdlib if the layer doesn't provide it
 try:
-    import requests
-    import pytz
-except ImportError as e:
-    print(f"Import error: {e}")
+    import orjson
 
-logger = logging.getLogger()
-logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO'))
+    def _dumps(obj):
+        try:
+            return orjson.dumps(obj).decode()
+        except orjson.JSONEncodeError:
+            # orjson rejects integers outside 64 bits; the stdlib encodes them exactly
+            return json.dumps(obj)
+except ImportError:
+    _dumps = json.dumps
+
+# Request bodies are parsed with the stdlib: orjson.loads silently turns integers
+# outside 64 bits into floats, which would corrupt the echoed data
+_loads = json.loads
+
+logger = logging.getLogger(__name__)
+logger.setLevel(getattr(logging, os.environ.get('LOG_LEVEL', 'INFO').upper(), logging.INFO))
+
+# Read once at import; Lambda env vars cannot change within a container
+_ENV = os.environ.get('ENVIRONMENT', 'unknown')
+
+# Headers are identical for every response, so build them once
+_HEADERS = {
+    'Content-Type': 'application/json',
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
+    'Access-Control-Allow-Headers': 'Content-Type'
+}
 
 
 def handler(event, context):
@@ -29,50 +54,48 @@ def handler(event, context):
     Returns:
         dict: HTTP response with statusCode, headers, and body
     """
-    logger.info(f"Received HTTP request: {event.get('requestContext', {}).get('http', {})}")
+    http = event.get('requestContext', {}).get('http', {})
+    logger.info("Received HTTP request: %s", http)
     
     try:
         # Parse HTTP request
-        http_method = event.get('requestContext', {}).get('http', {}).get('method', 'GET')
+        http_method = http.get('method', 'GET')
         path = event.get('rawPath', '/')
         query_params = event.get('queryStringParameters', {})
         headers = event.get('headers', {})
-        body = event.get('body', '')
+        now_iso = datetime.now(timezone.utc).isoformat()
         
         # Route request
-        if path == '/' and http_method == 'GET':
-            response_body = handle_root(query_params)
-        elif path == '/health' and http_method == 'GET':
-            response_body = handle_health()
-        elif path == '/api/data' and http_method == 'POST':
-            request_data = json.loads(body) if body else {}
-            response_body = handle_post_data(request_data)
-        else:
-            response_body = {
+        route = _ROUTES.get((path, http_method))
+        if route is None:
+            return create_response(404, {
                 'error': 'Not found',
                 'path': path,
                 'method': http_method
-            }
-            status_code = 404
-            return create_response(status_code, response_body)
+            })
         
-        return create_response(200, response_body)
+        return create_response(200, route(query_params, event, now_iso))
         
-    except json.JSONDecodeError as e:
-        logger.error(f"JSON decode error: {e}")
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        # Decoded base64 bodies reach json.loads as bytes, which must be UTF-8
+        logger.error("JSON decode error: %s", e)
         return create_response(400, {'error': 'Invalid JSON in request body'})
         
+    except binascii.Error as e:
+        logger.error("Base64 decode error: %s", e)
+        return create_response(400, {'error': 'Invalid base64 in request body'})
+        
     except Exception as e:
-        logger.error(f"Error handling request: {e}", exc_info=True)
+        logger.error("Error handling request: %s", e, exc_info=True)
         return create_response(500, {'error': 'Internal server error', 'message': str(e)})
 
 
-def handle_root(query_params):
+def handle_root(query_params, now_iso):
     """Handle root path request."""
     return {
         'message': 'Welcome to Lambda Function URL API',
-        'timestamp': datetime.now(pytz.UTC).isoformat(),
-        'environment': os.environ.get('ENVIRONMENT', 'unknown'),
+        'timestamp': now_iso,
+        'environment': _ENV,
         'query_params': query_params,
         'endpoints': {
             'GET /': 'This message',
@@ -82,31 +105,59 @@ def handle_root(query_params):
     }
 
 
-def handle_health():
+def handle_health(now_iso):
     """Handle health check request."""
     return {
         'status': 'healthy',
-        'timestamp': datetime.now(pytz.UTC).isoformat(),
-        'checks': {
-            'requests_library': check_library_import('requests'),
-            'boto3_library': check_library_import('boto3'),
-            'pytz_library': check_library_import('pytz')
-        }
+        'timestamp': now_iso,
+        'checks': _library_checks()
     }
 
 
-def handle_post_data(data):
+def handle_post_data(data, now_iso):
     """Handle POST data request."""
-    logger.info(f"Processing POST data: {data}")
+    logger.info("Processing POST data: %s", data)
     
     return {
         'message': 'Data received and processed',
-        'timestamp': datetime.now(pytz.UTC).isoformat(),
+        'timestamp': now_iso,
         'received_data': data,
         'processed': True
     }
 
 
+def parse_json_body(event):
+    """Parse the JSON request body, decoding it first if it is base64-encoded."""
+    body = event.get('body', '')
+    if not body:
+        return {}
+    if event.get('isBase64Encoded', False):
+        # Decoded bytes go straight to the JSON parser without a str round-trip
+        body = base64.b64decode(body, validate=True)
+    return _loads(body)
+
+
+# Route table keyed on (path, method); each route takes (query_params, event, now_iso)
+# and reads the body itself, so routes that ignore it never decode or reject it
+_ROUTES = {
+    ('/', 'GET'): lambda query_params, event, now_iso: handle_root(query_params, now_iso),
+    ('/health', 'GET'): lambda query_params, event, now_iso: handle_health(now_iso),
+    ('/api/data', 'POST'): lambda query_params, event, now_iso: handle_post_data(
+        parse_json_body(event), now_iso
+    ),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _library_checks():
+    """Check the layer libraries once; availability can't change within a container."""
+    return {
+        'requests_library': check_library_import('requests'),
+        'boto3_library': check_library_import('boto3'),
+        'orjson_library': check_library_import('orjson')
+    }
+
+
 def check_library_import(library_name):
     """Check if a library can be imported."""
     try:
@@ -120,13 +171,8 @@ def create_response(status_code, body):
     """Create HTTP response object."""
     return {
         'statusCode': status_code,
-        'headers': {
-            'Content-Type': 'application/json',
-            'Access-Control-Allow-Origin': '*',
-            'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
-            'Access-Control-Allow-Headers': 'Content-Type'
-        },
-        'body': json.dumps(body, indent=2)
+        'headers': _HEADERS,
+        'body': _dumps(body)
     }
 
 
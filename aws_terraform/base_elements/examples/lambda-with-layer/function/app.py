@@ -6,22 +6,44 @@ This example demonstrates using the requests library from the layer.
 import json
 import os
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 
-# These imports come from the Lambda layer
+# These imports come from the Lambda layer; if it isn't attached, init fails here
+import requests
+import boto3
+from botocore.config import Config
+
+# orjson is optional: fall back to the stdlib if the layer doesn't provide it
 try:
-    import requests
-    import boto3
-    from dateutil import parser
-    import pytz
-except ImportError as e:
-    print(f"Import error: {e}")
-    print("Make sure the Lambda layer is attached with required dependencies")
+    import orjson
+
+    def _dumps(obj, indent=False):
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+        except orjson.JSONEncodeError:
+            # orjson rejects integers outside 64 bits; the stdlib encodes them exactly
+            return json.dumps(obj, indent=2 if indent else None)
+except ImportError:
+    def _dumps(obj, indent=False):
+        return json.dumps(obj, indent=2 if indent else None)
 
 # Configure logging
-logger = logging.getLogger()
-log_level = os.environ.get('LOG_LEVEL', 'INFO')
-logger.setLevel(getattr(logging, log_level))
+logger = logging.getLogger(__name__)
+logger.setLevel(getattr(logging, os.environ.get('LOG_LEVEL', 'INFO').upper(), logging.INFO))
+
+# Environment variables are fixed for the container's lifetime
+_ENV = os.environ.get('ENVIRONMENT', 'unknown')
+_LAYER_VERSION = os.environ.get('LAYER_VERSION', 'unknown')
+
+# Create clients once per container so warm invocations reuse their
+# connection pools instead of reconnecting on every request
+_S3 = boto3.client('s3', config=Config(
+    max_pool_connections=50,
+    retries={'max_attempts': 2, 'mode': 'standard'},
+    connect_timeout=2,
+    read_timeout=5
+))
+_HTTP = requests.Session()
 
 
 def handler(event, context):
@@ -35,11 +57,8 @@ def handler(event, context):
     Returns:
         dict: Response object with statusCode and body
     """
-    logger.info(f"Received event: {json.dumps(event)}")
-    
-    # Get environment variables
-    environment = os.environ.get('ENVIRONMENT', 'unknown')
-    layer_version = os.environ.get('LAYER_VERSION', 'unknown')
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Received event: %s", _dumps(event))
     
     try:
         action = event.get('action', 'process')
@@ -55,26 +74,26 @@ def handler(event, context):
         
         # Add metadata
         result['metadata'] = {
-            'timestamp': datetime.now(pytz.UTC).isoformat(),
-            'environment': environment,
-            'layer_version': layer_version,
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'environment': _ENV,
+            'layer_version': _LAYER_VERSION,
             'function_name': context.function_name,
             'request_id': context.request_id
         }
         
         response = {
             'statusCode': 200,
-            'body': json.dumps(result, indent=2)
+            'body': _dumps(result, indent=True)
         }
         
         logger.info("Request processed successfully")
         return response
         
     except Exception as e:
-        logger.error(f"Error processing request: {str(e)}", exc_info=True)
+        logger.error("Error processing request: %s", e, exc_info=True)
         return {
             'statusCode': 500,
-            'body': json.dumps({
+            'body': _dumps({
                 'error': str(e),
                 'message': 'Internal server error'
             })
@@ -83,31 +102,30 @@ def handler(event, context):
 
 def process_data(data):
     """Process data using layer dependencies."""
-    logger.info(f"Processing data: {data}")
+    logger.info("Processing data: %s", data)
     
     # Example: Use boto3 from layer to list S3 buckets
     try:
-        s3 = boto3.client('s3')
-        buckets = s3.list_buckets()
+        buckets = _S3.list_buckets()
         bucket_count = len(buckets.get('Buckets', []))
     except Exception as e:
-        logger.warning(f"Could not list S3 buckets: {e}")
+        logger.warning("Could not list S3 buckets: %s", e)
         bucket_count = 0
     
     return {
         'message': 'Data processed successfully',
         'data': data,
         's3_buckets_accessible': bucket_count,
-        'layer_libraries': ['requests', 'boto3', 'python-dateutil', 'pytz']
+        'layer_libraries': ['requests', 'boto3', 'python-dateutil', 'orjson']
     }
 
 
 def fetch_data(url):
     """Fetch data from URL using requests library from layer."""
-    logger.info(f"Fetching data from: {url}")
+    logger.info("Fetching data from: %s", url)
     
     try:
-        response = requests.get(url, timeout=10)
+        response = _HTTP.get(url, timeout=10)
         response.raise_for_status()
         
         return {
@@ -117,7 +135,7 @@ def fetch_data(url):
             'data': response.json() if response.headers.get('content-type', '').startswith('application/json') else response.text[:100]
         }
     except requests.RequestException as e:
-        logger.error(f"Request failed: {e}")
+        logger.error("Request failed: %s", e)
         raise
 
 
@@ -0,0 +1,106 @@
+"""
+Shared helpers for the AWS Lex V2 example Lambda functions
+Purpose: Booking numbers, pricing, date formatting and Close responses
+Used by: booking-bot-simple/lambda/booking_fulfillment.py,
+         lambda-integration/lambda/dialog_hook.py,
+         lambda-integration/lambda/fulfillment_hook.py
+Packaged: Zipped alongside each handler by the example's archive_file
+"""
+
+import functools
+import random
+import string
+
+# Nightly room prices (GBP)
+ROOM_PRICES = {
+    'single': 89.99,
+    'double': 129.99,
+    'suite': 249.99
+}
+
+# Simulated bookings exist for any booking number starting with A or B (either case)
+DEMO_BOOKING_PREFIXES = frozenset('AaBb')
+
+# Every Close response carries the same dialogAction, so share one instance
+_CLOSE_ACTION = {'type': 'Close'}
+
+_LETTERS = string.ascii_uppercase
+
+# Number of distinct booking numbers: 26**3 letter triples x 10**5 digit runs
+_BOOKING_NUMBER_SPACE = 26 ** 3 * 100000
+
+
+def generate_booking_number():
+    """Generate a unique booking confirmation number"""
+    # Format: ABC12345 (3 letters + 5 digits), all taken from one 64-bit random draw
+    rest, digits = divmod(random.getrandbits(64) % _BOOKING_NUMBER_SPACE, 100000)
+    rest, third = divmod(rest, 26)
+    first, second = divmod(rest, 26)
+    return f'{_LETTERS[first]}{_LETTERS[second]}{_LETTERS[third]}{digits:05d}'
+
+
+# Check-in dates repeat across turns and bookings; the mapping is pure, so memoize it.
+# lru_cache hashes the argument first, so it must be hashable (slot values are str or None)
+@functools.lru_cache(maxsize=1024)
+def format_date_for_display(iso_date):
+    """Convert ISO date (YYYY-MM-DD) to display format (DD/MM/YYYY for en_GB)"""
+    # Lex AMAZON.Date values are always YYYY-MM-DD, so rearrange the fields directly;
+    # anything else is returned unchanged
+    if isinstance(iso_date, str) and len(iso_date) == 10 and iso_date[4] == '-' and iso_date[7] == '-':
+        return f'{iso_date[8:10]}/{iso_date[5:7]}/{iso_date[:4]}'
+    return iso_date
+
+
+# ========================================
+# Lex Response Helper Functions
+# ========================================
+
+def _close(intent, fulfillment_state, message, session_attributes=None):
+    """Build a Close response for an intent taken from the event's sessionState"""
+    intent['state'] = fulfillment_state
+    
+    session_state = {
+        'dialogAction': _CLOSE_ACTION,
+        'intent': intent
+    }
+    if session_attributes:
+        session_state['sessionAttributes'] = session_attributes
+    
+    return {
+        'sessionState': session_state,
+        'messages': [
+            {
+                'contentType': 'PlainText',
+                'content': message
+            }
+        ]
+    }
+
+
+def close_fulfilled(event, message, session_attributes=None, booking_number=None):
+    """Return successful fulfillment response"""
+    intent = event['sessionState']['intent']
+    
+    # Add booking number to slot if provided
+    if booking_number and 'slots' in intent:
+        if 'BookingNumber' not in intent['slots'] or intent['slots']['BookingNumber'] is None:
+            intent['slots']['BookingNumber'] = {
+                'shape': 'Scalar',
+                'value': {
+                    'originalValue': booking_number,
+                    'interpretedValue': booking_number,
+                    'resolvedValues': [booking_number]
+                }
+            }
+    
+    return _close(intent, 'Fulfilled', message, session_attributes)
+
+
+def close_failed(event, message):
+    """Return failed fulfillment response"""
+    return _close(event['sessionState']['intent'], 'Failed', message)
+
+
+def close_unsupported_intent(event):
+    """Fail an intent that the function has no fulfillment for"""
+    return close_failed(event, "I'm sorry, I couldn't process that request.")
@@ -6,11 +6,33 @@ Invoked: After confirmation from the user
 
 import json
 import logging
-import uuid
-from datetime import datetime
+import os
+from datetime import datetime, timezone
 
-logger = logging.getLogger()
-logger.setLevel(logging.INFO)
+from _lex_common import (
+    ROOM_PRICES,
+    close_failed,
+    close_fulfilled,
+    close_unsupported_intent,
+    format_date_for_display,
+    generate_booking_number,
+)
+
+# orjson is optional: fall back to the stdlib if it isn't packaged with the function
+try:
+    import orjson
+
+    def _dumps(obj):
+        try:
+            return orjson.dumps(obj).decode()
+        except orjson.JSONEncodeError:
+            # orjson rejects integers outside 64 bits; the stdlib encodes them exactly
+            return json.dumps(obj)
+except ImportError:
+    _dumps = json.dumps
+
+logger = logging.getLogger(__name__)
+logger.setLevel(getattr(logging, os.environ.get('LOG_LEVEL', 'INFO').upper(), logging.INFO))
 
 
 def lambda_handler(event, context):
@@ -22,14 +44,12 @@ def lambda_handler(event, context):
     - invocationSource: DialogCodeHook or FulfillmentCodeHook
     - bot: bot information
     """
-    logger.info(f"Received event: {json.dumps(event)}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Received event: %s", _dumps(event))
     
     intent_name = event['sessionState']['intent']['name']
     
-    if intent_name == 'BookRoom':
-        return fulfill_booking(event)
-    else:
-        return close_failed(event, "I'm sorry, I couldn't process that request.")
+    return _INTENT_HANDLERS.get(intent_name, close_unsupported_intent)(event)
 
 
 def fulfill_booking(event):
@@ -46,13 +66,7 @@ def fulfill_booking(event):
         booking_number = generate_booking_number()
         
         # Calculate pricing
-        room_prices = {
-            'single': 89.99,
-            'double': 129.99,
-            'suite': 249.99
-        }
-        
-        price_per_night = room_prices.get(room_type.lower(), 99.99)
+        price_per_night = ROOM_PRICES.get(room_type.lower(), 99.99)
         total_price = price_per_night * nights
         
         # Log the booking (in production, this would save to database)
@@ -62,9 +76,10 @@ def fulfill_booking(event):
             'check_in_date': check_in_date,
             'nights': nights,
             'total_price': total_price,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds')
         }
-        logger.info(f"Booking created: {json.dumps(booking_data)}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Booking created: %s", _dumps(booking_data))
         
         # Format check-in date for display (DD/MM/YYYY for en_GB)
         check_in_display = format_date_for_display(check_in_date)
@@ -88,87 +103,17 @@ def fulfill_booking(event):
         return close_fulfilled(event, message, session_attributes, booking_number)
         
     except KeyError as e:
-        logger.error(f"Missing required slot: {e}")
+        logger.error("Missing required slot: %s", e)
         return close_failed(event, "I'm sorry, some booking information is missing. Please try again.")
     except Exception as e:
-        logger.error(f"Error processing booking: {e}")
+        logger.error("Error processing booking: %s", e)
         return close_failed(
             event,
             "I'm sorry, an unexpected error occurred. Please try again or contact support."
         )
 
 
-def generate_booking_number():
-    """Generate a unique booking confirmation number"""
-    # Format: ABC12345 (3 letters + 5 digits)
-    letters = ''.join([chr(ord('A') + (uuid.uuid4().int % 26)) for _ in range(3)])
-    numbers = str(uuid.uuid4().int)[:5]
-    return f"{letters}{numbers}"
-
-
-def format_date_for_display(iso_date):
-    """Convert ISO date (YYYY-MM-DD) to display format (DD/MM/YYYY for en_GB)"""
-    try:
-        date_obj = datetime.strptime(iso_date, '%Y-%m-%d')
-        return date_obj.strftime('%d/%m/%Y')
-    except:
-        return iso_date
-
-
-def close_fulfilled(event, message, session_attributes=None, booking_number=None):
-    """Return successful fulfillment response"""
-    intent = event['sessionState']['intent']
-    intent['state'] = 'Fulfilled'
-    
-    # Add booking number to slot if provided
-    if booking_number and 'slots' in intent:
-        if 'BookingNumber' not in intent['slots'] or intent['slots']['BookingNumber'] is None:
-            intent['slots']['BookingNumber'] = {
-                'shape': 'Scalar',
-                'value': {
-                    'originalValue': booking_number,
-                    'interpretedValue': booking_number,
-                    'resolvedValues': [booking_number]
-                }
-            }
-    
-    response = {
-        'sessionState': {
-            'dialogAction': {
-                'type': 'Close'
-            },
-            'intent': intent
-        },
-        'messages': [
-            {
-                'contentType': 'PlainText',
-                'content': message
-            }
-        ]
-    }
-    
-    if session_attributes:
-        response['sessionState']['sessionAttributes'] = session_attributes
-    
-    return response
-
-
-def close_failed(event, message):
-    """Return failed fulfillment response"""
-    intent = event['sessionState']['intent']
-    intent['state'] = 'Failed'
-    
-    return {
-        'sessionState': {
-            'dialogAction': {
-                'type': 'Close'
-            },
-            'intent': intent
-        },
-        'messages': [
-            {
-                'contentType': 'PlainText',
-                'content': message
-            }
-        ]
-    }
+# Intent name -> fulfillment function, used by lambda_handler
+_INTENT_HANDLERS = {
+    'BookRoom': fulfill_booking
+}
@@ -16,11 +16,20 @@ provider "aws" {
 # Lambda Function for Fulfillment
 # ============================================
 
-# Archive Lambda code
+# Archive Lambda code together with the helpers shared by the example bots
 data "archive_file" "lambda_code" {
   type        = "zip"
-  source_file = "${path.module}/lambda/booking_fulfillment.py"
   output_path = "${path.module}/.terraform/booking_fulfillment.zip"
+
+  source {
+    content  = file("${path.module}/lambda/booking_fulfillment.py")
+    filename = "booking_fulfillment.py"
+  }
+
+  source {
+    content  = file("${path.module}/../_lex_common.py")
+    filename = "_lex_common.py"
+  }
 }
 
 # Lambda function using lambda_function module
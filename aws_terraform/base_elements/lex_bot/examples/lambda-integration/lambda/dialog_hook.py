@@ -6,10 +6,32 @@ Invoked: At each conversation turn before slot is filled
 
 import json
 import logging
-from datetime import datetime, timedelta
+import os
+import zlib
+from datetime import date, timedelta
 
-logger = logging.getLogger()
-logger.setLevel(logging.INFO)
+from _lex_common import DEMO_BOOKING_PREFIXES, close_fulfilled
+
+# orjson is optional: fall back to the stdlib if it isn't packaged with the function
+try:
+    import orjson
+
+    def _dumps(obj):
+        try:
+            return orjson.dumps(obj).decode()
+        except orjson.JSONEncodeError:
+            # orjson rejects integers outside 64 bits; the stdlib encodes them exactly
+            return json.dumps(obj)
+except ImportError:
+    _dumps = json.dumps
+
+logger = logging.getLogger(__name__)
+logger.setLevel(getattr(logging, os.environ.get('LOG_LEVEL', 'INFO').upper(), logging.INFO))
+
+_VALID_ROOM_TYPES = frozenset({'single', 'double', 'suite'})
+
+# Delegate dialogAction never varies; shared by every response (Lex only reads it)
+_DELEGATE_ACTION = {'type': 'Delegate'}
 
 
 def lambda_handler(event, context):
@@ -22,31 +44,32 @@ def lambda_handler(event, context):
     - bot: bot information
     - inputTranscript: user's input text
     """
-    logger.info(f"Received event: {json.dumps(event)}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Received event: %s", _dumps(event))
     
     intent_name = event['sessionState']['intent']['name']
     invocation_source = event['invocationSource']
     
-    # Route to appropriate intent handler
-    if intent_name == 'BookRoom':
-        return handle_book_room_dialog(event)
-    elif intent_name == 'CancelBooking':
-        return handle_cancel_booking_dialog(event)
-    elif intent_name == 'CheckAvailability':
-        return handle_check_availability_dialog(event)
-    else:
-        # Default response
-        return delegate(event)
+    # Route to appropriate intent handler; anything else is delegated back to Lex
+    return _INTENT_HANDLERS.get(intent_name, delegate)(event)
 
 
 def handle_book_room_dialog(event):
     """Validate booking slots during conversation"""
     slots = event['sessionState']['intent']['slots']
     
+    # Read each slot value once; None/empty means the slot isn't filled yet
+    room_type_slot = slots.get('RoomType')
+    room_type_value = room_type_slot and room_type_slot.get('value')
+    check_in_slot = slots.get('CheckInDate')
+    check_in_value = check_in_slot and check_in_slot.get('value')
+    nights_slot = slots.get('Nights')
+    nights_value = nights_slot and nights_slot.get('value')
+    
     # Validate RoomType
-    if slots.get('RoomType') and slots['RoomType'].get('value'):
-        room_type = slots['RoomType']['value']['interpretedValue']
-        if room_type.lower() not in ['single', 'double', 'suite']:
+    if room_type_value:
+        room_type = room_type_value['interpretedValue']
+        if room_type.lower() not in _VALID_ROOM_TYPES:
             return elicit_slot(
                 event,
                 'RoomType',
@@ -54,14 +77,14 @@ def handle_book_room_dialog(event):
             )
     
     # Validate CheckInDate
-    if slots.get('CheckInDate') and slots['CheckInDate'].get('value'):
-        check_in_date_str = slots['CheckInDate']['value']['interpretedValue']
+    if check_in_value:
+        check_in_date_str = check_in_value['interpretedValue']
         try:
-            check_in_date = datetime.strptime(check_in_date_str, '%Y-%m-%d')
-            today = datetime.now()
+            check_in_date = date.fromisoformat(check_in_date_str)
+            today = date.today()
             
             # Check if date is in the past
-            if check_in_date.date() < today.date():
+            if check_in_date < today:
                 return elicit_slot(
                     event,
                     'CheckInDate',
@@ -85,9 +108,9 @@ def handle_book_room_dialog(event):
             )
     
     # Validate Nights
-    if slots.get('Nights') and slots['Nights'].get('value'):
+    if nights_value:
         try:
-            nights = int(slots['Nights']['value']['interpretedValue'])
+            nights = int(nights_value['interpretedValue'])
             if nights < 1:
                 return elicit_slot(
                     event,
@@ -108,8 +131,7 @@ def handle_book_room_dialog(event):
             )
     
     # Check room availability (simulated)
-    if all(slots.get(slot) and slots[slot].get('value') for slot in ['RoomType', 'CheckInDate', 'Nights']):
-        room_type = slots['RoomType']['value']['interpretedValue']
+    if room_type_value and check_in_value and nights_value:
         availability = check_room_availability(room_type)
         
         if not availability:
@@ -160,42 +182,48 @@ def handle_check_availability_dialog(event):
         
         message = f"We currently have {available_count} {room_type} rooms available."
         
-        return close(
-            event,
-            'Fulfilled',
-            message
-        )
+        return close_fulfilled(event, message)
     
     # General availability
-    return close(
+    return close_fulfilled(
         event,
-        'Fulfilled',
         "We have rooms available across all our room types. Would you like to book one?"
     )
 
 
+# Intent name -> dialog validation function, used by lambda_handler
+_INTENT_HANDLERS = {
+    'BookRoom': handle_book_room_dialog,
+    'CancelBooking': handle_cancel_booking_dialog,
+    'CheckAvailability': handle_check_availability_dialog
+}
+
+
 # ========================================
 # Helper Functions - Simulated Backend
 # ========================================
 
+def _room_type_hash(room_type):
+    """Stable hash of a room type so simulated results repeat across invocations"""
+    return zlib.crc32(room_type.lower().encode())
+
+
 def check_room_availability(room_type):
     """Simulate checking room availability"""
     # In real implementation, this would query a database or booking system
-    import random
-    return random.choice([True, True, True, False])  # 75% availability
+    return (_room_type_hash(room_type) & 3) != 0  # 75% of room types available
 
 
 def verify_booking_exists(booking_number):
     """Simulate verifying booking exists"""
     # In real implementation, this would query a database
     # For demo, accept any booking number starting with 'A' or 'B'
-    return booking_number[0].upper() in ['A', 'B']
+    return booking_number[:1] in DEMO_BOOKING_PREFIXES
 
 
 def get_available_rooms(room_type):
     """Simulate getting available room count"""
-    import random
-    return random.randint(1, 10)
+    return (_room_type_hash(room_type) & 0x0F) % 10 + 1
 
 
 # ========================================
@@ -206,9 +234,7 @@ def delegate(event):
     """Delegate back to Lex to continue the conversation"""
     return {
         'sessionState': {
-            'dialogAction': {
-                'type': 'Delegate'
-            },
+            'dialogAction': _DELEGATE_ACTION,
             'intent': event['sessionState']['intent']
         }
     }
@@ -231,24 +257,3 @@ def elicit_slot(event, slot_to_elicit, message):
             }
         ]
     }
-
-
-def close(event, fulfillment_state, message):
-    """Close the dialog with a final message"""
-    intent = event['sessionState']['intent']
-    intent['state'] = fulfillment_state
-    
-    return {
-        'sessionState': {
-            'dialogAction': {
-                'type': 'Close'
-            },
-            'intent': intent
-        },
-        'messages': [
-            {
-                'contentType': 'PlainText',
-                'content': message
-            }
-        ]
-    }
@@ -6,11 +6,44 @@ Invoked: After all required slots are filled and confirmation is complete
 
 import json
 import logging
-import uuid
-from datetime import datetime
-
-logger = logging.getLogger()
-logger.setLevel(logging.INFO)
+import os
+import random
+from datetime import datetime, timezone
+
+from _lex_common import (
+    DEMO_BOOKING_PREFIXES,
+    ROOM_PRICES,
+    close_failed,
+    close_fulfilled,
+    close_unsupported_intent,
+    format_date_for_display,
+    generate_booking_number,
+)
+
+# orjson is optional: fall back to the stdlib if it isn't packaged with the function
+try:
+    import orjson
+
+    def _dumps(obj):
+        try:
+            return orjson.dumps(obj).decode()
+        except orjson.JSONEncodeError:
+            # orjson rejects integers outside 64 bits; the stdlib encodes them exactly
+            return json.dumps(obj)
+except ImportError:
+    _dumps = json.dumps
+
+logger = logging.getLogger(__name__)
+logger.setLevel(getattr(logging, os.environ.get('LOG_LEVEL', 'INFO').upper(), logging.INFO))
+
+# Details returned for every simulated booking lookup; never mutated
+_MOCK_BOOKING = {
+    'room_type': 'double',
+    'check_in_date': '2026-03-15',
+    'nights': 3,
+    'total_price': 389.97,
+    'status': 'confirmed'
+}
 
 
 def lambda_handler(event, context):
@@ -23,17 +56,13 @@ def lambda_handler(event, context):
     - bot: bot information
     - inputTranscript: user's input text
     """
-    logger.info(f"Received fulfillment event: {json.dumps(event)}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Received fulfillment event: %s", _dumps(event))
     
     intent_name = event['sessionState']['intent']['name']
     
     # Route to appropriate intent fulfillment
-    if intent_name == 'BookRoom':
-        return fulfill_book_room(event)
-    elif intent_name == 'CancelBooking':
-        return fulfill_cancel_booking(event)
-    else:
-        return close_failed(event, "I'm sorry, I couldn't process that request.")
+    return _INTENT_HANDLERS.get(intent_name, close_unsupported_intent)(event)
 
 
 def fulfill_book_room(event):
@@ -50,13 +79,7 @@ def fulfill_book_room(event):
         booking_number = generate_booking_number()
         
         # Calculate total price (simulated)
-        room_prices = {
-            'single': 89.99,
-            'double': 129.99,
-            'suite': 249.99
-        }
-        
-        price_per_night = room_prices.get(room_type.lower(), 99.99)
+        price_per_night = ROOM_PRICES.get(room_type.lower(), 99.99)
         total_price = price_per_night * nights
         
         # Simulate booking in database
@@ -66,7 +89,7 @@ def fulfill_book_room(event):
             'check_in_date': check_in_date,
             'nights': nights,
             'total_price': total_price,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds')
         })
         
         if booking_result['success']:
@@ -95,10 +118,10 @@ def fulfill_book_room(event):
             )
             
     except KeyError as e:
-        logger.error(f"Missing required slot: {e}")
+        logger.error("Missing required slot: %s", e)
         return close_failed(event, "I'm sorry, some booking information is missing. Please try again.")
     except Exception as e:
-        logger.error(f"Error fulfilling booking: {e}")
+        logger.error("Error fulfilling booking: %s", e)
         return close_failed(
             event,
             "I'm sorry, an unexpected error occurred. Please try again or contact support."
@@ -142,32 +165,31 @@ def fulfill_cancel_booking(event):
             )
             
     except KeyError as e:
-        logger.error(f"Missing booking number: {e}")
+        logger.error("Missing booking number: %s", e)
         return close_failed(event, "I need a booking number to process the cancellation.")
     except Exception as e:
-        logger.error(f"Error fulfilling cancellation: {e}")
+        logger.error("Error fulfilling cancellation: %s", e)
         return close_failed(event, "An unexpected error occurred. Please contact support.")
 
 
+# Intent name -> fulfillment function, used by lambda_handler
+_INTENT_HANDLERS = {
+    'BookRoom': fulfill_book_room,
+    'CancelBooking': fulfill_cancel_booking
+}
+
+
 # ========================================
 # Simulated Backend Functions
 # ========================================
 
-def generate_booking_number():
-    """Generate a unique booking confirmation number"""
-    # Format: ABC12345 (3 letters + 5 digits)
-    letters = ''.join([chr(ord('A') + (uuid.uuid4().int % 26)) for _ in range(3)])
-    numbers = str(uuid.uuid4().int)[:5]
-    return f"{letters}{numbers}"
-
-
 def create_booking(booking_data):
     """Simulate creating booking in database"""
     # In real implementation, this would insert into a database
-    logger.info(f"Creating booking: {json.dumps(booking_data)}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Creating booking: %s", _dumps(booking_data))
     
     # Simulate 98% success rate
-    import random
     success = random.random() < 0.98
     
     return {
@@ -180,84 +202,17 @@ def get_booking_details(booking_number):
     """Simulate retrieving booking from database"""
     # In real implementation, this would query a database
     # For demo, return mock data for bookings starting with 'A' or 'B'
-    if booking_number[0].upper() in ['A', 'B']:
-        return {
-            'booking_number': booking_number,
-            'room_type': 'double',
-            'check_in_date': '2026-03-15',
-            'nights': 3,
-            'total_price': 389.97,
-            'status': 'confirmed'
-        }
+    if booking_number[:1] in DEMO_BOOKING_PREFIXES:
+        return {'booking_number': booking_number, **_MOCK_BOOKING}
     return None
 
 
 def cancel_booking(booking_number):
     """Simulate cancelling booking in database"""
     # In real implementation, this would update the database
-    logger.info(f"Cancelling booking: {booking_number}")
+    logger.info("Cancelling booking: %s", booking_number)
     
     return {
         'success': True,
         'booking_number': booking_number
     }
-
-
-def format_date_for_display(iso_date):
-    """Convert ISO date (YYYY-MM-DD) to display format (DD/MM/YYYY for en_GB)"""
-    try:
-        date_obj = datetime.strptime(iso_date, '%Y-%m-%d')
-        return date_obj.strftime('%d/%m/%Y')
-    except:
-        return iso_date
-
-
-# ========================================
-# Lex Response Helper Functions
-# ========================================
-
-def close_fulfilled(event, message, session_attributes=None):
-    """Return successful fulfillment response"""
-    intent = event['sessionState']['intent']
-    intent['state'] = 'Fulfilled'
-    
-    response = {
-        'sessionState': {
-            'dialogAction': {
-                'type': 'Close'
-            },
-            'intent': intent
-        },
-        'messages': [
-            {
-                'contentType': 'PlainText',
-                'content': message
-            }
-        ]
-    }
-    
-    if session_attributes:
-        response['sessionState']['sessionAttributes'] = session_attributes
-    
-    return response
-
-
-def close_failed(event, message):
-    """Return failed fulfillment response"""
-    intent = event['sessionState']['intent']
-    intent['state'] = 'Failed'
-    
-    return {
-        'sessionState': {
-            'dialogAction': {
-                'type': 'Close'
-            },
-            'intent': intent
-        },
-        'messages': [
-            {
-                'contentType': 'PlainText',
-                'content': message
-            }
-        ]
-    }
@@ -19,14 +19,34 @@ provider "aws" {
 # Archive Lambda code
 data "archive_file" "dialog_hook" {
   type        = "zip"
-  source_file = "${path.module}/lambda/dialog_hook.py"
   output_path = "${path.module}/.terraform/dialog_hook.zip"
+
+  source {
+    content  = file("${path.module}/lambda/dialog_hook.py")
+    filename = "dialog_hook.py"
+  }
+
+  # Close responses and demo booking prefixes shared with the fulfillment hook
+  source {
+    content  = file("${path.module}/../_lex_common.py")
+    filename = "_lex_common.py"
+  }
 }
 
 data "archive_file" "fulfillment_hook" {
   type        = "zip"
-  source_file = "${path.module}/lambda/fulfillment_hook.py"
   output_path = "${path.module}/.terraform/fulfillment_hook.zip"
+
+  source {
+    content  = file("${path.module}/lambda/fulfillment_hook.py")
+    filename = "fulfillment_hook.py"
+  }
+
+  # Helpers shared with the booking-bot-simple fulfillment function
+  source {
+    content  = file("${path.module}/../_lex_common.py")
+    filename = "_lex_common.py"
+  }
 }
 
 # Lambda function for dialog hook (validation) using lambda_function module
@@ -39,6 +59,7 @@ module "dialog_hook" {
   runtime       = "python3.11"
   timeout       = 10
   memory_size   = 256
+  layers        = var.lambda_layer_arns
 
   filename         = data.archive_file.dialog_hook.output_path
   source_code_hash = data.archive_file.dialog_hook.output_base64sha256
@@ -67,6 +88,7 @@ module "fulfillment_hook" {
   runtime       = "python3.11"
   timeout       = 30
   memory_size   = 512
+  layers        = var.lambda_layer_arns
 
   filename         = data.archive_file.fulfillment_hook.output_path
   source_code_hash = data.archive_file.fulfillment_hook.output_base64sha256
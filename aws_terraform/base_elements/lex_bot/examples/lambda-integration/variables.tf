@@ -26,3 +26,9 @@ variable "log_retention_days" {
   type        = number
   default     = 14
 }
+
+variable "lambda_layer_arns" {
+  description = "Optional Lambda layer ARNs for the hook functions (e.g. a layer providing orjson for faster JSON logging)"
+  type        = list(string)
+  default     = []
+}